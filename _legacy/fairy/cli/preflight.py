@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 from pathlib import Path
-import json
 import typer
 
-from fairy.core.services.validator import run_rulepack
-
-app = typer.Typer(help="FAIRy CLI commands")
+# no shell-completion hooks: keeps `--help` cold start small
+app = typer.Typer(help="FAIRy CLI commands", add_completion=False)
 
 @app.command("preflight")
 def preflight(
@@ -48,6 +46,10 @@ def preflight(
             --out out/report.json
     """
 
+    # imported here so `--help` doesn't pull in pandas / the validator stack
+    from fairy.core.services.validator import run_rulepack
+    from fairy.core.jsonio import dump_json
+
     rulepack_path = Path(rulepack).resolve()
     samples_path = Path(samples).resolve()
     files_path = Path(files).resolve()
@@ -63,8 +65,8 @@ def preflight(
     # ensure output dir exists
     out_path.parents.mkdir(parents=True, exist_ok=True)
 
-    with open(out_path, "w") as f:
-        json.dump(report, f, indent=2)
+    # orjson straight to bytes when installed (stdlib json otherwise)
+    dump_json(out_path, report)
 
     # friendly terminal summary
     att = report["attestation"]
@@ -1,22 +1,26 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import sys
 from pathlib import Path
 from hashlib import sha256
-from ..core.services.report_writer import write_report, _now_utc_iso
-from ..core.services.validator import run_rulepack
-from ..core.validation_api import validate_csv
-from ..core.validators import generic, rna
-from typing import Optional
+from typing import Collection, Optional, Sequence
 
+from ..core.jsonio import dump_json, json_bytes, json_loads
+# Engine imports (pandas, jsonschema, validators) are deferred into the
+# branches that need them so `fairy --version` / `--help` start fast.
 
 try:
     from fairy import __version__ as FAIRY_VERSION
 except Exception:
     FAIRY_VERSION = "0.1.0"
 
+# One findings-table row in the preflight Markdown report
+_MD_FINDING_ROW = "| {sev} | {code} | {where} | {why} | {fix} |"
+# Escapes '|' inside Markdown table cells (built once, reused per cell)
+_MD_PIPE_TRANS = str.maketrans({"|": "\\|"})
+
 def sha256_bytes(b: bytes) -> str:
     h = sha256()
     h.update(b)
@@ -42,8 +46,7 @@ def _emit_markdown(md_path: Path, payload: dict) -> None:
     if not checks:
         lines.append("- None")
     else:
-        for w in checks:
-            lines.append(f"- {w.get('code', 'warn')} - {w.get('message', '')}")
+        lines.extend(f"- {w.get('code', 'warn')} - {w.get('message', '')}" for w in checks)
     md_path.parent.mkdir(parents=True, exist_ok=True)
     md_path.write_text("\n".join(lines), encoding="utf-8")
 
@@ -152,8 +155,13 @@ def _version_text(rulepack: Path | None) -> str:
     return f"fairy {FAIRY_VERSION}\nrulepack: {rp}"
 
 def _build_payload(csv_path: Path, kind: str) -> tuple[dict, bytes]:
+    from ..core.services.report_writer import _now_utc_iso
+    from ..core.validation_api import validate_csv_bytes
+    from ..core.validators import generic, rna  # noqa: F401  (registers validators)
+
+    # read the file once; the same bytes feed both hashing and validation
     data_bytes = csv_path.read_bytes()
-    meta_obj = validate_csv(str(csv_path), kind=kind)
+    meta_obj = validate_csv_bytes(data_bytes, kind=kind)
     meta = {
         "n_rows": meta_obj.n_rows,
         "n_cols": meta_obj.n_cols,
@@ -186,98 +194,162 @@ def _resolve_input_path(p: Path) -> Path:
         return p
     
     if p.is_dir():
-        csvs = list(p.glob("*.csv"))
-        if len(csvs) == 1:
-            return csvs[0]
-        if len(csvs) == 0:
+        # Stop scanning as soon as a second CSV shows up; only the
+        # error path below needs the full listing.
+        first: str | None = None
+        extra = False
+        with os.scandir(p) as it:
+            for e in it:
+                if e.name.endswith(".csv") and e.is_file():
+                    if first is None:
+                        first = e.path
+                    else:
+                        extra = True
+                        break
+        if first is None:
             raise FileNotFoundError(
                 f"No CSV file found in directory {p}."
                 "Expected something like metadata.csv."
             )
-        names = ", ".join(c.name for c in csvs)
+        if not extra:
+            return Path(first)
+        names = ", ".join(sorted(c.name for c in p.glob("*.csv") if c.is_file()))
         raise FileNotFoundError(
             f"Multiple CSVs found in {p}: {names}."
             "Please specify which file you want."
         )
     raise FileNotFoundError(f"{p} is not a file or directory")
 
-def _load_last_codes(cache_path: Path) -> set[str] | None:
+def _load_last_codes(cache_path: Path) -> tuple[str, ...] | None:
     """
     Read previously saved finding codes from last run.
-    Returns a set of codes (e.g. {"CORE.ID.UNMATCHED_SAMPLE", ...})
+    Returns a sorted tuple of codes (e.g. ("CORE.ID.UNMATCHED_SAMPLE", ...))
     or None if no cache yet.
     """
 
     if not cache_path.exists():
         return None
     try:
-        raw = json.loads(cache_path.read_text(encoding="utf-8"))
+        raw = json_loads(cache_path.read_bytes())
         # Expecting {"codes": ["AAA", "BBB", ...]}
         codes_list = raw.get("codes", [])
-        # Defensive cast to set[str]
-        return set(str(c) for c in codes_list)
+        # Defensive cast to str; the cache is written sorted, so this
+        # sort is a linear already-ordered pass in the normal case
+        return tuple(sorted(str(c) for c in codes_list))
     except Exception:
         # If cache is corrupt, just ignore it this run
         return None
     
-def _save_last_codes(cache_path: Path, codes: set[str]) -> None:
+def _save_last_codes(cache_path: Path, codes: list[str]) -> None:
     """
     Persist finding codes for next run's diff.
+    `codes` must already be sorted and unique (see _partition_codes).
     Overwrites each run
     """
-    payload = {"codes": sorted(codes)}
-    cache_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2),
-        encoding="utf-8",
+    payload = {"codes": list(codes)}
+    dump_json(cache_path, payload)
+
+def _resolved_codes(prior_codes: Sequence[str], curr_codes: Sequence[str]) -> list[str]:
+    """
+    Codes present in prior_codes but not in curr_codes, in sorted order.
+    Both inputs must be sorted; this is a single two-pointer merge.
+    """
+    resolved: list[str] = []
+    j, n = 0, len(curr_codes)
+    for code in prior_codes:
+        while j < n and curr_codes[j] < code:
+            j += 1
+        if (j == n or curr_codes[j] != code) and (not resolved or resolved[-1] != code):
+            resolved.append(code)
+    return resolved
+
+def _fmt_input_block(label: str, meta: dict) -> list[str]:
+    """Markdown provenance block for one input sheet."""
+    if not meta:
+        return [f"### {label}", "", "_no input metadata_", ""]
+    return [
+        f"### {label}",
+        "",
+        f"- path: '{meta.get('path', '?')}'",
+        f"- sha256: '{meta.get('sha256', '?')}'",
+        f"- rows: '{meta.get('n_rows', '?')}'",
+        f"- cols: '{meta.get('n_cols', '?')}'",
+        ""
+    ]
+
+def _fmt_file_info(label: str, meta: dict) -> str:
+    """Console provenance lines for one input sheet."""
+    if not meta:
+        return f"{label}: (no input metadata)"
+    sha = meta.get("sha256", "?")
+    rows = meta.get("n_rows", "?")
+    cols = meta.get("n_cols", "?")
+    path = meta.get("path", "?")
+    return (
+        f"{label} sha256: {sha}\n"
+        f"  path: {path}\n"
+        f"  rows:{rows} cols:{cols}"
     )
 
+def _partition_codes(findings: list[dict]) -> tuple[list[str], list[str], list[str]]:
+    """
+    One pass over findings -> sorted (all codes, FAIL codes, WARN codes).
+    """
+    curr_codes: set[str] = set()
+    fail_codes: set[str] = set()
+    warn_codes: set[str] = set()
+    for f in findings:
+        code = f["code"]
+        curr_codes.add(code)
+        sev = f["severity"]
+        if sev == "FAIL":
+            fail_codes.add(code)
+        elif sev == "WARN":
+            warn_codes.add(code)
+    return sorted(curr_codes), sorted(fail_codes), sorted(warn_codes)
+
 def _emit_preflight_markdown(
         md_path: Path,
         att: dict,
         report: dict,
         resolved_codes: list[str],
-        prior_codes: set[str] | None,
+        prior_codes: Collection[str] | None,
+        fail_codes: list[str] | None = None,
+        warn_codes: list[str] | None = None,
 ) -> None:
     """
     Write a curator-facing one-pager in Markdown that mirrors the CLI output.
+    Pass fail_codes/warn_codes (sorted) when the caller already has them;
+    otherwise they are derived from report["findings"].
     """
 
     inputs = att.get("inputs", {})
     samples_info = inputs.get("samples", {})
     files_info = inputs.get("files" ,{})
 
-    def _fmt_input_block(label: str, meta: dict) -> list[str]:
-        if not meta:
-            return[f"### {label}", "", "_no input metadata_", ""]
-        return [
-            f"### {label}",
-            "",
-            f"- path: '{meta.get('path', '?')}'",
-            f"- sha256: '{meta.get('sha256', '?')}'",
-            f"- rows: '{meta.get('n_rows', '?')}'",
-            f"- cols: '{meta.get('n_cols', '?')}'",
-            ""
-        ]
-    
     # summarize active codes
-    fail_codes = sorted({f["code"] for f in report["findings"] if f["severity"] == "FAIL"})
-    warn_codes = sorted({f["code"] for f in report["findings"] if f["severity"] == "WARN"})
+    if fail_codes is None or warn_codes is None:
+        _, fail_codes, warn_codes = _partition_codes(report["findings"])
 
     # Build findings table rows
-    # One row per finding, so curator can see all issues
+    # One row per finding, so curator can see all issues.
+    # Rows come from a single template and are joined once (no per-row list appends);
+    # pipes are escaped via the shared _MD_PIPE_TRANS table (one translate() per cell).
+    table_rows = "\n".join(
+        _MD_FINDING_ROW.format(
+            sev=f.get("severity", "?"),
+            code=f.get("code", "?"),
+            where=f.get("where", "").translate(_MD_PIPE_TRANS),
+            why=f.get("why", "").translate(_MD_PIPE_TRANS),
+            fix=f.get("how_to_fix", "").translate(_MD_PIPE_TRANS),
+        )
+        for f in report["findings"]
+    )
     table_lines = [
         "| Severity | Code | Location | Why it matters | How to fix |",
         "|----------|------|----------|----------------|------------|",
+        table_rows,
     ]
-    for f in report["findings"]:
-        sev = f.get("severity", "?")
-        code = f.get("code", "?")
-        where = f.get("where", "").replace("|", r"\|")
-        why = f.get("why", "").replace("|", r"\|")
-        fix = f.get("how_to_fix", "").replace("|", r"\|")
-        table_lines.append(
-            f"| {sev} | {code} | {where} | {why} | {fix} |"
-        )
 
     # Resolved since last run block
     if prior_codes is None:
@@ -377,10 +449,7 @@ def main(argv: list[str] | None = None) -> int:
         if args.report_json:
             args.report_json.parent.mkdir(parents=True, exist_ok=True)
             # write JSON report directly to the requested file
-            args.report_json.write_text(
-                json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True),
-                encoding="utf-8",
-            )
+            dump_json(args.report_json, payload, sort_keys=True)
             wrote_any = True
 
         if args.report_md:
@@ -389,6 +458,8 @@ def main(argv: list[str] | None = None) -> int:
 
         # legacy path: existing directory-based writer
         if not wrote_any:
+            from ..core.services.report_writer import write_report
+
             path = write_report(
                 out_dir=args.out,
                 filename=csv_path.name,
@@ -410,6 +481,8 @@ def main(argv: list[str] | None = None) -> int:
     # 'preflight' subcommand (NEW: GEO-style submission check)
     if args.command == "preflight":
         # Run the high-level rulepack runner on samples.tsv/files.tsv
+        from ..core.services.validator import run_rulepack
+
         report = run_rulepack(
             rulepack_path=args.rulepack.resolve(),
             samples_path=args.samples.resolve(),
@@ -419,18 +492,15 @@ def main(argv: list[str] | None = None) -> int:
 
         # Write machine-readable FAIRy report (attestation + findings)
         args.out.parent.mkdir(parents=True, exist_ok=True)
-        args.out.write_text(
-            json.dumps(report, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        dump_json(args.out, report)
 
         att = report["attestation"]
 
         # where we cache last-run codes
         cache_path = args.out.parent / ".fairy_last_run.json"
 
-        # Build set of current codes
-        curr_codes = {f["code"] for f in report["findings"]}
+        # Build set of current codes (+ FAIL/WARN code lists) in one pass
+        curr_codes, fail_codes, warn_codes = _partition_codes(report["findings"])
 
         # Load previous run's codes (if any)
         prior_codes = _load_last_codes(cache_path)
@@ -438,7 +508,7 @@ def main(argv: list[str] | None = None) -> int:
         # Compute "resolved" = codes that used to exist but are gone now
         resolved_codes: list[str] = []
         if prior_codes is not None:
-            resolved_codes = sorted(prior_codes - curr_codes)
+            resolved_codes = _resolved_codes(prior_codes, curr_codes)
 
         # Save current codes for next run
         _save_last_codes(cache_path, curr_codes)
@@ -451,67 +521,59 @@ def main(argv: list[str] | None = None) -> int:
             report=report,
             resolved_codes=resolved_codes,
             prior_codes=prior_codes,
+            fail_codes=fail_codes,
+            warn_codes=warn_codes,
         )
 
         #=== Pretty console summary for humans / screenshots / CI logs
-        print("")
-        print("=== FAIRy Preflight ===")
-        print(f"Rulepack:         {att['rulepack_id']}@{att['rulepack_version']}")
-        print(f"FAIRy version:    {att['fairy_version']}")
-        print(f"Run at (UTC):     {att['run_at_utc']}")
-
-        fail_codes = sorted({f["code"] for f in report["findings"] if f["severity"] == "FAIL"})
-        warn_codes = sorted({f["code"] for f in report["findings"] if f["severity"] == "WARN"})
-
-        print(f"FAIL findings:    {att['fail_count']} {fail_codes}")
-        print(f"WARN findings:    {att['warn_count']} {warn_codes}")
-
-        print(f"submission_ready: {att['submission_ready']}")
-        print(f"Report JSON:      {args.out}")
-        print("")
+        # Collected into one buffer and written once (not ~20 print() calls)
+        out = [
+            "",
+            "=== FAIRy Preflight ===",
+            f"Rulepack:         {att['rulepack_id']}@{att['rulepack_version']}",
+            f"FAIRy version:    {att['fairy_version']}",
+            f"Run at (UTC):     {att['run_at_utc']}",
+            f"FAIL findings:    {att['fail_count']} {fail_codes}",
+            f"WARN findings:    {att['warn_count']} {warn_codes}",
+            f"submission_ready: {att['submission_ready']}",
+            f"Report JSON:      {args.out}",
+            "",
+        ]
 
         # show file provenance for trust / auditability
         inputs = att.get("inputs", {})
         samples_info = inputs.get("samples", {})
         files_info = inputs.get("files", {})
 
-        def _fmt_file_info(label: str, meta:dict) -> str:
-            if not meta:
-                return f"{label}: (no input metadata)"
-            sha = meta.get("sha256", "?")
-            rows = meta.get("n_rows", "?")
-            cols = meta.get("n_cols", "?")
-            path = meta.get("path", "?")
-            return (
-                f"{label} sha256: {sha}\n"
-                f"  path: {path}\n"
-                f"  rows:{rows} cols:{cols}"
-            )    
-
-        print("Input provenance:")
-        print(_fmt_file_info("samples.tsv", samples_info))
-        print(_fmt_file_info("files.tsv", files_info))
-        print("")                        
+        out += [
+            "Input provenance:",
+            _fmt_file_info("samples.tsv", samples_info),
+            _fmt_file_info("files.tsv", files_info),
+            "",
+        ]
 
         if report["findings"]:
             f0 = report["findings"][0]
-            print("Example finding:")
-            print(f"  [{f0['severity']}] {f0['code']} @ {f0['where']}")
-            print(f"    why: {f0['why']}")
-            print(f"    fix: {f0['how_to_fix']}")
-            print("")
-
-        #Print resolved diff block
-        print("Resolved since last run:")
+            out += [
+                "Example finding:",
+                f"  [{f0['severity']}] {f0['code']} @ {f0['where']}",
+                f"    why: {f0['why']}",
+                f"    fix: {f0['how_to_fix']}",
+                "",
+            ]
+
+        # resolved diff block
+        out.append("Resolved since last run:")
         if prior_codes is None:
             # first run or cache missing/corrupt
-            print("  (no baseline from prior run)")
+            out.append("  (no baseline from prior run)")
         elif not resolved_codes:
-            print("  (no previously-reported issues resolved)")
+            out.append("  (no previously-reported issues resolved)")
         else:
-            for code in resolved_codes:
-                print(f"  ✔ {code}")
-        print("")
+            out.extend(f"  ✔ {code}" for code in resolved_codes)
+        out.append("")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
         # Exit code for automation / CI:
         # - submission_ready == False (at least one FAIL) -> exit 1
@@ -546,7 +608,7 @@ def demo_alias_main() -> int:
     if old.dry_run:
         # Build in-memory payload and pretty-print instead of writing to disk
         payload, _ = _build_payload(csv_path, kind = old.kind)
-        print(json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True))
+        print(json_bytes(payload, sort_keys=True).decode("utf-8"))
         return 0
     
     #Legacy writer path
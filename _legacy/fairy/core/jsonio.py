@@ -0,0 +1,42 @@
+# fairy/core/jsonio.py
+# JSON encode/decode shared by the CLI, the validator and the report writers.
+# Uses orjson when installed (pip install .[fast]), else stdlib json; both
+# produce the same pretty (indent=2) UTF-8 documents.
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+try:
+    import orjson  # optional: native JSON encoder/decoder
+except ImportError:
+    orjson = None
+
+
+def json_bytes(obj, *, sort_keys: bool = False) -> bytes:
+    """Pretty (indent=2) UTF-8 JSON. Uses orjson when installed, else stdlib json."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys).encode("utf-8")
+
+def dump_json(path: Path, obj, *, sort_keys: bool = False) -> None:
+    """
+    Write obj to path as pretty UTF-8 JSON (same bytes as json_bytes).
+    orjson encodes straight to bytes; the stdlib fallback streams through
+    json.dump instead of building the whole document as one str first.
+    """
+    if orjson is not None:
+        path.write_bytes(json_bytes(obj, sort_keys=sort_keys))
+        return
+    with path.open("w", encoding="utf-8", newline="") as fp:
+        json.dump(obj, fp, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+
+def json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes. Uses orjson when installed, else stdlib json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,16 +1,21 @@
 # fairy/core/services/export_adapter.py
 from __future__ import annotations
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timezone
-import json
 import hashlib
 import shutil
 import os
+import time
+import zipfile
 
 from ..services.validator import run_rulepack
+from ..jsonio import dump_json
 from ...cli.run import _emit_preflight_markdown, FAIRY_VERSION  # reuse your MD emitter
 
+# Bundle members with these suffixes are already compressed; store, don't deflate
+_PRECOMPRESSED_SUFFIXES = (".gz", ".bgz", ".bz2", ".xz", ".zst", ".zip", ".bam", ".cram")
+
 @dataclass
 class ExportResult:
     export_dir: Path
@@ -21,18 +26,60 @@ class ExportResult:
     report_md_path: Path
 
 def _sha256_of_file(p: Path) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    with p.open("rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read/update loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # 3.10 fallback: reuse one 1 MiB buffer instead of allocating per chunk
+        h = hashlib.sha256()
+        buf = bytearray(1024 * 1024)
+        mv = memoryview(buf)
+        while n := f.readinto(mv):
+            h.update(mv[:n])
+        return h.hexdigest()
+
+def _scandir_recursive(path):
+    """
+    Yield os.DirEntry for every regular file under path (depth-first).
+    Symlinks are skipped; unreadable directories are ignored.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    # FIFOs / sockets / devices are skipped (reading a FIFO blocks)
+                    yield entry
+    except PermissionError:
+        return
+
+def _link_or_copy(src: Path, dst: Path, *, allow_link: bool = False) -> None:
+    """
+    Materialize src at dst without duplicating bytes when possible.
+
+    A hardlink shares the inode with src, so later edits to src would show up
+    in the "snapshot". We therefore only link when the caller opts in or src is
+    read-only; otherwise (or on cross-device / permission errors) we copy.
+    """
+    read_only = not (src.stat().st_mode & 0o222)
+    if allow_link or read_only:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
 
 def _now_utc_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # Same shape as datetime.now(timezone.utc).isoformat(), without building a datetime
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))}.{ns // 1000:06d}+00:00"
 
 def _write_json(path: Path, obj: dict) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+    dump_json(path, obj)
     return path
 
 def run_preflight_and_write(
@@ -75,29 +122,58 @@ def _shim_build_bundle(
     samples: Path,
     files: Path,
     report_json: Path,
+    compress: bool = True,
+    known_digests: dict[str, str] | None = None,
 ) -> tuple[Path, Path, Path]:
     """
     Temporary shim until fairy_core.export.build_bundle is available.
     - Writes manifest.json (sha256, size, relpath) for key files
     - Writes provenance.json (who/when/version/inputs)
     - Creates bundle.zip containing the export_dir contents
+      (fast deflate, level 1; already-compressed files are stored as-is;
+      compress=False stores everything)
+
+    known_digests maps manifest relpath -> sha256 for files whose digest is
+    already known (e.g. inputs hashed during preflight); those are not re-hashed.
     """
-    manifest_items = []
-    def _add(p: Path):
-        rel = p.relative_to(export_dir).as_posix()
-        manifest_items.append({
+    known_digests = known_digests or {}
+
+    def _manifest_item(entry: os.DirEntry) -> dict:
+        rel = Path(os.path.relpath(entry.path, export_dir)).as_posix()
+        digest = known_digests.get(rel)
+        if digest is None:
+            digest = _sha256_of_file(Path(entry.path))
+        return {
             "path": rel,
-            "sha256": _sha256_of_file(p),
-            "bytes": p.stat().st_size,
-        })
+            "sha256": digest,
+            "bytes": entry.stat(follow_symlinks=True).st_size,
+        }
 
     # Write manifest.json
     manifest_path = export_dir / "manifest.json"
-    # Include canonical files present in export_dir
-    for candidate in ["samples.tsv", "files.tsv", "report", "report.md"]:
-        pc = export_dir / candidate
-        if pc.exists():
-            _add(pc)
+    # Include canonical files present in export_dir; one scandir pass instead of
+    # probing each candidate (DirEntry caches the stat result)
+    candidates = ["samples.tsv", "files.tsv", "report", "report.md"]
+    found: dict[str, os.DirEntry] = {}
+    with os.scandir(export_dir) as it:
+        for entry in it:
+            if entry.name in candidates and not entry.is_symlink():
+                found[entry.name] = entry
+    entries: list[os.DirEntry] = []
+    for candidate in candidates:
+        entry = found.get(candidate)
+        if entry is None:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            entries.extend(sorted(_scandir_recursive(entry.path), key=lambda e: e.path))
+        elif entry.is_file(follow_symlinks=False):
+            entries.append(entry)
+
+    # hashlib releases the GIL while hashing, so files hash in parallel;
+    # ex.map keeps results in candidate order for a deterministic manifest
+    workers = max(1, min(len(entries), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        manifest_items = list(ex.map(_manifest_item, entries))
     _write_json(manifest_path, manifest_items)
 
     # Write provenance.json
@@ -105,8 +181,8 @@ def _shim_build_bundle(
         "created_at_utc": _now_utc_iso(),
         "fairy_version": FAIRY_VERSION,
         "inputs": {
-            "samples": (export_dir / "samples.tsv").as_posix() if (export_dir / "samples.tsv").exists() else None,
-            "files": (export_dir / "files.tsv").as_posix() if (export_dir / "files.tsv").exists() else None,
+            "samples": (export_dir / "samples.tsv").as_posix() if "samples.tsv" in found else None,
+            "files": (export_dir / "files.tsv").as_posix() if "files.tsv" in found else None,
             "report_json": report_json.as_posix(),
         },
         "environment": {
@@ -118,9 +194,19 @@ def _shim_build_bundle(
 
     # Create bundle.zip
     # Make a temp folder name to avoid zipping the zip itself on re-runs
-    zip_base = export_dir.parent / f"{export_dir.name}_bundle"
-    zip_path_str = shutil.make_archive(str(zip_base), "zip", root_dir=export_dir)
-    zip_path = Path(zip_path_str)
+    zip_path = export_dir.parent / f"{export_dir.name}_bundle.zip"
+    if compress:
+        zip_opts = {"compression": zipfile.ZIP_DEFLATED, "compresslevel": 1}
+    else:
+        zip_opts = {"compression": zipfile.ZIP_STORED}
+    with zipfile.ZipFile(zip_path, "w", allowZip64=True, **zip_opts) as zf:
+        for entry in sorted(_scandir_recursive(export_dir), key=lambda e: e.path):
+            arcname = Path(os.path.relpath(entry.path, export_dir)).as_posix()
+            # deflating gz/zip/bam payloads burns CPU for ~0 gain
+            if compress and entry.name.lower().endswith(_PRECOMPRESSED_SUFFIXES):
+                zf.write(entry.path, arcname=arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(entry.path, arcname=arcname)
 
     return zip_path, manifest_path, provenance_path
 
@@ -131,15 +217,17 @@ def export_submission(
     samples: Path,
     files: Path,
     fairy_version: str = FAIRY_VERSION,
+    link_inputs: bool = False,
 ) -> ExportResult:
     """
     One-call export for the UI:
       - creates timestamped export dir
       - runs preflight and writes report + report.md
       - copies samples/files into export dir (so the ZIP is self-contained)
+        (link_inputs=True hardlinks them instead when on the same filesystem)
       - builds manifest/provenance and zip (shim)
     """
-    ts = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    ts = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
     export_dir = (project_dir / "exports" / ts).resolve()
     export_dir.mkdir(parents=True, exist_ok=True)
 
@@ -155,11 +243,11 @@ def export_submission(
         raise RuntimeError("Export requested while submission_ready == False")
 
     # 2) ensure inputs are copied next to the report so bundle is complete
-    # (If you prefer symlinks, adjust accordingly)
+    # (hardlinked instead when allowed; see _link_or_copy)
     dst_samples = export_dir / "samples.tsv"
     dst_files = export_dir / "files.tsv"
-    shutil.copy2(samples, dst_samples)
-    shutil.copy2(files, dst_files)
+    _link_or_copy(samples, dst_samples, allow_link=link_inputs)
+    _link_or_copy(files, dst_files, allow_link=link_inputs)
 
     # 3) build shim bundle: manifest.json, provenance.json, bundle.zip
     zip_path, manifest_path, provenance_path = _shim_build_bundle(
@@ -167,6 +255,11 @@ def export_submission(
         samples=dst_samples,
         files=dst_files,
         report_json=report_path,
+        # copies are byte-identical to what preflight already hashed
+        known_digests={
+            "samples.tsv": att["inputs"]["samples"]["sha256"],
+            "files.tsv": att["inputs"]["files"]["sha256"],
+        },
     )
 
     return ExportResult(
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json, jsonschema
+import jsonschema
 from dataclasses import asdict, is_dataclass
 from datetime import datetime, UTC
 from pathlib import Path
 from typing import List, Optional
 
+from ..jsonio import json_bytes, json_loads
 from ..models.report_v0 import (
     DatasetId,
     InputFile,
@@ -103,12 +104,12 @@ def write_report(
         scores={"preflight": 0.0},
     )
 
-    schema = json.loads(SCHEMA_PATH.read_text())
+    schema = json_loads(SCHEMA_PATH.read_bytes())
     report_dict = _to_dict(report)
     jsonschema.validate(instance=report_dict, schema=schema)
 
     path = out_path / "report.json"
-    path.write_text(json.dumps(report_dict, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    path.write_bytes(json_bytes(report_dict, sort_keys=True) + b"\n")
     
     print(f"[FAIRy] Wrote {path.resolve()}")
     return path
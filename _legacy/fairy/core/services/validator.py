@@ -9,14 +9,17 @@
 #   - loads samples.tsv and files.tsv
 #   - calls helper checks in validators/rna.py
 #   - maps WarningItem -> FAIRy Findings with code / severity / where / why / how_to_fix
+#     (iter_findings yields them one at a time)
 #   - builds Attestation
 #   - returns {attestation, findings}
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import json
-from typing import List, Dict, Any
+import os
+from typing import Callable, Iterator, List, Dict, Any
 import pandas as pd
 from hashlib import sha256
 
@@ -30,6 +33,7 @@ from ..validation_api import (
     validate_csv as _core_validate_csv,  # <-- NEW: import the canonical validate_csv
 )
 
+from ..jsonio import json_loads
 from ..validators import rna  # to call check_* helpers
 
 
@@ -64,17 +68,38 @@ def _where_from_issue(issue: WarningItem, fallback_where: str) -> str:
 
 # === provenance helpers
 
-def _sha256_file(p: Path) -> str:
+def _hash_and_scan(p: Path) -> tuple[str, bytes, int]:
     """
-    Return sha256 hex digest of file at path p.
-    Chunked so we don't load huge files fully into memory.
+    One streaming pass over p that returns (sha256 hex, first line, n_lines).
+    The same 1 MiB chunks feed the hash and the line-break count, so the file
+    is read once and never split into per-line Python objects.
+    LF, CRLF and lone CR (old Mac / Excel "CSV (Macintosh)") all end a line,
+    as in text mode, so n_lines matches len(text.splitlines()) for them.
     """
-
     h = sha256()
+    first_line = bytearray()
+    have_first = False
+    n_breaks = 0
+    prev_cr = False  # previous chunk ended in \r (a CRLF may straddle chunks)
+    last = b""
     with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
+        while chunk := f.read(1 << 20):
             h.update(chunk)
-    return h.hexdigest()
+            # every \n and every \r is a break, except the \r of a \r\n pair
+            n_crlf = chunk.count(b"\r\n") + (1 if prev_cr and chunk.startswith(b"\n") else 0)
+            n_breaks += chunk.count(b"\n") + chunk.count(b"\r") - n_crlf
+            if not have_first:
+                ends = [i for i in (chunk.find(b"\n"), chunk.find(b"\r")) if i != -1]
+                if ends:
+                    first_line += chunk[:min(ends)]
+                    have_first = True
+                else:
+                    first_line += chunk
+            prev_cr = chunk.endswith(b"\r")
+            last = chunk
+    # a final line without a trailing line break still counts as a line
+    n_lines = n_breaks + (1 if last and not last.endswith((b"\n", b"\r")) else 0)
+    return h.hexdigest(), bytes(first_line), n_lines
 
 def _summarize_tabular(p: Path) -> Dict[str, Any]:
     """
@@ -85,44 +110,26 @@ def _summarize_tabular(p: Path) -> Dict[str, Any]:
     -n_cols
     -header (list[str])
 
-    Will *try* to use Frictionless if available for more robust parsing.
-    If that fails or isn't installed, we fall back to simple TSV splitter.
+    Rows are counted from newlines in the same pass that hashes the file;
+    nothing parses or materializes individual data rows.
+    Set FAIRY_USE_FRICTIONLESS=1 to take the header from Frictionless
+    (if installed) instead of splitting the first line on tabs.
     """
     path_str = str(p)
-    file_hash = _sha256_file(p)
-
-    header: List[str] = []
-    n_cols = 0
-    n_rows = 0
-
-    #Try Frictionless first
-    try:
-        from frictionless import Resource # type: ignore
-        resource = Resource(path_str)
-
-        # header list
-        header = list(resource.header or [])
-        n_cols = len(header)
-
-        # Count rows via frictionless read_rows() (each is a dict-like row of data)
-        data_rows = resource.read_rows()
-        n_rows = len(data_rows)
-
-    except Exception:
-        # Fallback: naive TSV parse
-        with p.open("r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
-
-        if lines:
-            header_line = lines [0]
-            header = header_line.split("\t")
-            n_cols = len(header)
-            # everything after header is data rows
-            n_rows = max(len(lines) - 1, 0)
-        else:
-            header = []
-            n_cols = 0
-            n_rows = 0
+
+    file_hash, first_line, n_lines = _hash_and_scan(p)
+    # everything after header is data rows
+    n_rows = max(n_lines - 1, 0)
+    header: List[str] = first_line.decode("utf-8").split("\t") if n_lines else []
+
+    if os.environ.get("FAIRY_USE_FRICTIONLESS") == "1":
+        try:
+            from frictionless import Resource # type: ignore
+            header = list(Resource(path_str).header or [])
+        except Exception:
+            pass  # keep the naive TSV header
+
+    n_cols = len(header)
 
     return {
         "path": path_str,
@@ -132,100 +139,181 @@ def _summarize_tabular(p: Path) -> Dict[str, Any]:
         "header": header,
     }
 
-def run_rulepack(
-    rulepack_path: Path,
-    samples_path: Path,
-    files_path: Path,
-    fairy_version: str = "0.2.0",
-) -> dict:
-    # 1. load rulepack JSON
-    pack = json.loads(Path(rulepack_path).read_text())
+def _read_tsv(path: Path) -> pd.DataFrame:
+    """
+    Load a metadata TSV with every cell as str ("" for empty cells).
+    pandas' default NA tokens ("NA", "N/A", "null", ...) become "" as well,
+    so the rna.check_* helpers treat them as missing values.
+    """
+    return pd.read_csv(path, sep="\t", dtype=str).fillna("")
 
-    # 2. load dataframes
-    samples_df = pd.read_csv(samples_path, sep="\t", dtype=str).fillna("")
-    files_df = pd.read_csv(files_path, sep="\t", dtype=str).fillna("")
+@lru_cache(maxsize=32)
+def _load_rulepack_by_stat(path_str: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns/size are only part of the cache key
+    return json_loads(Path(path_str).read_bytes())
 
-    all_findings: List[dict] = []
+def _load_rulepack_cached(path: Path) -> dict:
+    """
+    Parsed rulepack JSON, memoized on (path, mtime_ns, size) so repeated
+    preflight runs against the same pack skip the read + parse.
+    Editing the file changes its stat key, which invalidates the entry.
+
+    The returned dict is shared between callers; treat it as read-only.
+    """
+    p = Path(path).resolve()
+    st = p.stat()
+    return _load_rulepack_by_stat(str(p), st.st_mtime_ns, st.st_size)
+
+def _finding_to_dict(f: Finding) -> Dict[str, Any]:
+    # report/JSON shape; cheaper than dataclasses.asdict (no deep copy)
+    return {
+        "code": f.code,
+        "severity": f.severity,
+        "where": f.where,
+        "why": f.why,
+        "how_to_fix": f.how_to_fix,
+        "details": f.details,
+    }
 
+# === rule dispatch
+# Each _dispatch_* takes (samples_df, files_df, spec) and returns WarningItems;
+# run_rulepack looks the handler up by spec["type"].
+
+def _dispatch_require_columns(samples_df, files_df, spec) -> List[WarningItem]:
+    required_cols = spec.get("required_columns", [])
+    return rna.check_required_columns(samples_df, required_cols)
+
+def _dispatch_bio_context(samples_df, files_df, spec) -> List[WarningItem]:
+    # spec["column_groups"] is like [["tissue","cell_line","cell_type"]]
+    column_groups = spec.get("column_groups", [])
+    group0 = column_groups[0] if column_groups else []
+    return rna.check_bio_context(samples_df, group0)
+
+def _dispatch_id_crosscheck(samples_df, files_df, spec) -> List[WarningItem]:
+    # left_key is the sample ID key in samples.tsv
+    left_key = spec.get("left_key", "sample_id")
+    return rna.check_id_crossmatch(
+        samples_df,
+        files_df,
+        samples_key=left_key,
+    )
+
+def _dispatch_paired_end_complete(samples_df, files_df, spec) -> List[WarningItem]:
+    # be defensive and default sanely
+    return rna.check_paired_end_complete(
+        files_df,
+        samples_key=spec.get("samples_key", "sample_id"),
+        layout_col=spec.get("layout_column", "layout"),
+        paired_value=spec.get("layout_value_for_paired", "PAIRED"),
+        file_col=spec.get("file_column", "filename"),
+        r1_pattern=spec.get("r1_pattern", r"_R1"),
+        r2_pattern=spec.get("r2_pattern", r"_R2"),
+    )
+
+def _dispatch_dates_iso8601(samples_df, files_df, spec) -> List[WarningItem]:
+    date_cols = spec.get("columns", [])
+    return rna.check_dates_iso8601(samples_df, date_cols)
+
+def _dispatch_processed_data_present(samples_df, files_df, spec) -> List[WarningItem]:
+    return rna.check_processed_data_present(
+        files_df,
+        samples_key=spec.get("samples_key", "sample_id"),
+        raw_file_glob=spec.get("raw_file_glob", ".fastq"),
+        processed_globs=spec.get(
+            "processed_glob_candidates",
+            [".counts", ".quant", ".gene_counts"],
+        ),
+    )
+
+def _dispatch_unknown(samples_df, files_df, spec) -> List[WarningItem]:
+    return []
+
+_DISPATCH: Dict[str, Callable[[pd.DataFrame, pd.DataFrame, dict], List[WarningItem]]] = {
+    "require_columns": _dispatch_require_columns,
+    "at_least_one_nonempty_per_row": _dispatch_bio_context,
+    "id_crosscheck": _dispatch_id_crosscheck,
+    "paired_end_complete": _dispatch_paired_end_complete,
+    "dates_are_iso8601": _dispatch_dates_iso8601,
+    "processed_data_present": _dispatch_processed_data_present,
+}
+
+def iter_findings(
+    pack: dict,
+    samples_df: pd.DataFrame,
+    files_df: pd.DataFrame,
+) -> Iterator[Finding]:
+    """
+    Run every rule in pack against the two sheets and yield one Finding per
+    WarningItem, in rule order. Findings are produced lazily, so a caller can
+    count / write them as they arrive instead of holding an extra copy.
+    """
     for rule in pack["rules"]:
         spec = rule["check"]
         ctype = spec["type"]
 
-        # dispatch to the right helper in rna.py
-        if ctype == "require_columns":
-            required_cols = spec.get("required_columns", [])
-            warning_items = rna.check_required_columns(samples_df, required_cols)
-
-        elif ctype == "at_least_one_nonempty_per_row":
-            # spec["column_groups"] is like [["tissue","cell_line","cell_type"]]
-            column_groups = spec.get("column_groups", [])
-            group0 = column_groups[0] if column_groups else []
-            warning_items = rna.check_bio_context(samples_df, group0)
-
-        elif ctype == "id_crosscheck":
-            # left_key is the sample ID key in samples.tsv
-            left_key = spec.get("left_key", "sample_id")
-            warning_items = rna.check_id_crossmatch(
-                samples_df,
-                files_df,
-                samples_key=left_key,
-            )
-
-        elif ctype == "paired_end_complete":
-            # be defensive and default sanely
-            warning_items = rna.check_paired_end_complete(
-                files_df,
-                samples_key=spec.get("samples_key", "sample_id"),
-                layout_col=spec.get("layout_column", "layout"),
-                paired_value=spec.get("layout_value_for_paired", "PAIRED"),
-                file_col=spec.get("file_column", "filename"),
-                r1_pattern=spec.get("r1_pattern", r"_R1"),
-                r2_pattern=spec.get("r2_pattern", r"_R2"),
-            )
+        # dispatch to the right helper in rna.py (unknown types -> no findings)
+        warning_items = _DISPATCH.get(ctype, _dispatch_unknown)(samples_df, files_df, spec)
 
-        elif ctype == "dates_are_iso8601":
-            date_cols = spec.get("columns", [])
-            warning_items = rna.check_dates_iso8601(samples_df, date_cols)
-
-        elif ctype == "processed_data_present":
-            warning_items = rna.check_processed_data_present(
-                files_df,
-                samples_key=spec.get("samples_key", "sample_id"),
-                raw_file_glob=spec.get("raw_file_glob", ".fastq"),
-                processed_globs=spec.get(
-                    "processed_glob_candidates",
-                    [".counts", ".quant", ".gene_counts"],
-                ),
-            )
+        if not warning_items:
+            continue
 
-        else:
-            warning_items = []
+        # rule text is the same for every finding of this rule; read it once
+        r_code = rule["code"]
+        r_where = rule["where"]
+        r_why = rule["why"]
+        r_fix = rule["how_to_fix"]
 
         # convert WarningItem -> final FAIRy "finding"
         for w in warning_items:
-            mapped_sev = _map_severity(w.severity)
-            finding = {
-                "code": rule["code"],
-                "severity": mapped_sev,
-                "where": _where_from_issue(w, rule["where"]),
-                "why": rule["why"],
-                "how_to_fix": rule["how_to_fix"],
-                "details": {
+            yield Finding(
+                r_code,
+                _map_severity(w.severity),
+                _where_from_issue(w, r_where),
+                r_why,
+                r_fix,
+                {
                     "kind": w.kind,
                     "message": w.message,
                     "hint": w.hint,
                     "row": w.row,
                     "column": w.column,
                 },
-            }
-            all_findings.append(finding)
+            )
+
+def run_rulepack(
+    rulepack_path: Path,
+    samples_path: Path,
+    files_path: Path,
+    fairy_version: str = "0.2.0",
+    rulepack_obj: dict | None = None,
+) -> dict:
+    # 1. load rulepack JSON (unless the caller already parsed it);
+    #    memoized, so repeated runs in one process parse it once
+    if rulepack_obj is not None:
+        pack = rulepack_obj
+    else:
+        pack = _load_rulepack_cached(Path(rulepack_path))
+
+    # 2. load dataframes
+    samples_df = _read_tsv(samples_path)
+    files_df = _read_tsv(files_path)
 
-    fail_count = sum(1 for f in all_findings if f["severity"] == "FAIL")
-    warn_count = sum(1 for f in all_findings if f["severity"] == "WARN")
+    # 3. drain the findings stream straight into report dicts,
+    #    counting severities on the way (no extra passes afterwards)
+    all_findings: List[dict] = []
+    fail_count = warn_count = 0
+    for f in iter_findings(pack, samples_df, files_df):
+        if f.severity == "FAIL":
+            fail_count += 1
+        else:
+            warn_count += 1
+        all_findings.append(_finding_to_dict(f))
 
     # Capture provenance / trust info for each input sheet
-    samples_meta = _summarize_tabular(Path(samples_path))
-    files_meta = _summarize_tabular(Path(files_path))
+    # (hashing releases the GIL, so the two sheets are summarized concurrently)
+    input_paths = [Path(samples_path), Path(files_path)]
+    with ThreadPoolExecutor(max_workers=min(8, len(input_paths))) as ex:
+        samples_meta, files_meta = ex.map(_summarize_tabular, input_paths)
 
     attestation = {
         "rulepack_id": pack.get("rulepack_id", "UNKNOWN_RULEPACK"),
@@ -1,8 +1,9 @@
 # fairy/core/validation_api.py
 
 from __future__ import annotations
+import io
 from dataclasses import dataclass
-from typing import List, Dict, Protocol, Any, Optional
+from typing import IO, List, Dict, Protocol, Any, Optional
 from datetime import datetime, timezone
 
 # --- Basic types you already use ---
@@ -34,7 +35,9 @@ class Meta:
 class Validator(Protocol):
     name: str
     version: str
-    def validate(self, path: str) -> Meta:
+    # path may also be a binary file-like (see validate_csv_bytes);
+    # implementations hand it to pandas.read_csv, which accepts either
+    def validate(self, path: str | IO[bytes]) -> Meta:
         ...
 
 _VALIDATORS: Dict[str, Validator] = {}
@@ -45,15 +48,23 @@ def register(name: str, validator: Validator):
 def get_validator(kind: str) -> Optional[Validator]:
     return _VALIDATORS.get(kind)
 
-def validate_csv(path: str, kind: str = "rna") -> Meta:
+def validate_csv(path: str | IO[bytes], kind: str = "rna") -> Meta:
     v = _VALIDATORS.get(kind) or _VALIDATORS.get("generic")
     if v is None:
         raise RuntimeError(f"No validator registered for kind='{kind}' or 'generic'")
     return v.validate(path)
 
+def validate_csv_bytes(buf: bytes | memoryview, kind: str = "rna") -> Meta:
+    """
+    Same as validate_csv, but parses CSV content already in memory
+    (validators hand the file-like straight to pandas.read_csv).
+    Lets callers read a file once and reuse the bytes for hashing.
+    """
+    return validate_csv(io.BytesIO(buf), kind=kind)
+
 # --- Richer FAIRy finding types we'll add soon ---
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     code: str            # e.g. "GEO.REQ.MISSING_FIELD"
     severity: str        # "FAIL" | "WARN"
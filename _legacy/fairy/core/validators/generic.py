@@ -1,5 +1,7 @@
 # fairy/core/validators/generic.py
 
+from typing import IO
+
 import pandas as pd
 from ..validation_api import Meta, register
 
@@ -7,7 +9,7 @@ class GenericCSVValidator:
     name = "generic"
     version = "0.1.0"
 
-    def validate(self, path: str) -> Meta:
+    def validate(self, path: str | IO[bytes]) -> Meta:
         df = pd.read_csv(path)
 
         # No domain rules; just summarize the shape and the first ~50 columns
@@ -1,5 +1,5 @@
 import re
-from typing import List, Dict, Set
+from typing import IO, Callable, List, Dict, Set
 import pandas as pd
 
 from ..validation_api import Meta, WarningItem, register
@@ -12,7 +12,7 @@ class RNAValidator:
     REQUIRED = ["sample_id"]
     OPTIONAL = ["collection_date", "tissue", "cell_line", "cell_type", "read_length"]
 
-    def validate(self, path: str) -> Meta:
+    def validate(self, path: str | IO[bytes]) -> Meta:
         df = pd.read_csv(path)
 
         warnings: List[WarningItem] = []
@@ -169,10 +169,21 @@ def check_id_crossmatch(
         if str(x).strip() != ""
     )
 
-    # Check each row in files.tsv
-    for idx, row in files_df.iterrows():
-        sid = str(row.get(samples_key, "")).strip()
-        if sid == "":
+    # files.tsv repeats each sample_id once per file: as a categorical, the
+    # strip / lookup runs once per distinct id and rows just reuse the
+    # verdict for their integer code
+    ids = pd.Categorical(files_df[samples_key])
+    # missing cells get code -1, i.e. the extra last entry: str(NaN) == "nan"
+    cat_ids = pd.Index([str(c).strip() for c in ids.categories] + ["nan"])
+    cat_empty = cat_ids == ""
+    cat_bad = cat_empty | ~cat_ids.isin(known_ids)
+
+    # Report offending rows of files.tsv, in file order
+    codes = ids.codes
+    for pos in cat_bad[codes].nonzero()[0]:
+        idx = files_df.index[pos]
+        code = codes[pos]
+        if cat_empty[code]:
             issues.append(
                 WarningItem(
                     column=samples_key,
@@ -183,7 +194,8 @@ def check_id_crossmatch(
                     hint="Each file row must name the sample_id it belongs to.",
                 )
             )
-        elif sid not in known_ids:
+        else:
+            sid = cat_ids[code]
             issues.append(
                 WarningItem(
                     column=samples_key,
@@ -198,6 +210,18 @@ def check_id_crossmatch(
     return issues
 
 
+def _filename_matcher(pattern: str | re.Pattern) -> Callable[[str], bool]:
+    """
+    Predicate for "filename contains pattern". Literal patterns (like the
+    default "_R1"/"_R2") use a plain substring test instead of the regex
+    engine; anything with metacharacters, or an already compiled
+    re.Pattern, goes through .search.
+    """
+    if isinstance(pattern, str) and re.escape(pattern) == pattern:
+        return lambda fn: pattern in fn
+    return re.compile(pattern).search
+
+
 def check_paired_end_complete(
     files_df: pd.DataFrame,
     *,
@@ -205,8 +229,8 @@ def check_paired_end_complete(
     layout_col: str,
     paired_value: str,
     file_col: str,
-    r1_pattern: str,
-    r2_pattern: str,
+    r1_pattern: str | re.Pattern,
+    r2_pattern: str | re.Pattern,
 ) -> List[WarningItem]:
     """
     Spec: type == 'paired_end_complete'
@@ -217,6 +241,7 @@ def check_paired_end_complete(
             file_column                e.g. "filename"
             r1_pattern                 e.g. "_R1"
             r2_pattern                 e.g. "_R2"
+    (patterns may also be passed precompiled)
 
     Rule: for each paired sample (layout == paired_value),
     we expect both an R1 and an R2 file for that sample.
@@ -224,8 +249,8 @@ def check_paired_end_complete(
     """
     issues: List[WarningItem] = []
 
-    rx_r1 = re.compile(r1_pattern)
-    rx_r2 = re.compile(r2_pattern)
+    is_r1 = _filename_matcher(r1_pattern)
+    is_r2 = _filename_matcher(r2_pattern)
 
     # Filter just the paired rows first
     paired_rows = files_df[
@@ -239,8 +264,8 @@ def check_paired_end_complete(
 
         filenames = group[file_col].astype(str).tolist()
 
-        has_r1 = any(rx_r1.search(fn) for fn in filenames)
-        has_r2 = any(rx_r2.search(fn) for fn in filenames)
+        has_r1 = any(is_r1(fn) for fn in filenames)
+        has_r2 = any(is_r2(fn) for fn in filenames)
 
         if not has_r1 or not has_r2:
             first_idx = int(group.index[0]) if len(group.index) > 0 else None
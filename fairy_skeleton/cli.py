@@ -1,8 +1,12 @@
 # fairy_skeleton/cli.py
-import argparse, subprocess, sys, shutil
+import argparse, os, subprocess, sys
 from pathlib import Path
 
 DEMO_DIR = Path(__file__).resolve().parent.parent / "demos"
+RUN_DEMO_SH = DEMO_DIR.parent / "scripts" / "run_demo.sh"
+
+# env vars the demo reads (scripts/run_demo.sh owns their defaults)
+_RUN_DEMO_VARS = ("RULEPACK", "SAMPLES", "FILES", "OUT")
 
 def _find_configs():
     return sorted(p for p in DEMO_DIR.glob("*/config.yaml") if p.is_file())
@@ -11,14 +15,48 @@ def cmd_demos():
     for cfg in _find_configs():
         print(cfg.parent.name)
 
+def _run_demo(cfg: Path) -> None:
+    """
+    Run a demo the way scripts/run_demo.sh does. When RULEPACK/SAMPLES/FILES/OUT
+    are all set and fairy-core is importable, preflight runs inside this
+    interpreter (no bash, no second Python/pandas cold start); otherwise cfg
+    is handed to the script, which supplies the defaults.
+    """
+    opts = {k: os.environ.get(k) for k in _RUN_DEMO_VARS}
+    try:
+        from fairy.cli.run import main as fairy_main
+    except ImportError:
+        fairy_main = None
+    if fairy_main is None or not all(opts.values()):
+        subprocess.check_call(["bash", str(RUN_DEMO_SH), str(cfg)])
+        return
+
+    for key in ("RULEPACK", "SAMPLES", "FILES"):
+        if not Path(opts[key]).is_file():
+            print(f"Missing {key}: {opts[key]}")
+            sys.exit(2)
+
+    Path(opts["OUT"]).parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # like the script's `|| true`: a non-ready report is still a finished demo
+        fairy_main([
+            "preflight",
+            "--rulepack", opts["RULEPACK"],
+            "--samples", opts["SAMPLES"],
+            "--files", opts["FILES"],
+            "--out", opts["OUT"],
+        ])
+    except SystemExit:
+        pass
+    print(f"Wrote {opts['OUT']}")
+
 def cmd_run(name: str):
-    matches = [c for c in _find_configs() if c.parent.name == name]
-    if not matches:
+    cfg = DEMO_DIR / name / "config.yaml"  # direct stat, no demos/ scan
+    # only direct children of demos/ (as the old glob matched), no "../x"
+    if Path(name).name != name or name in (".", "..") or not cfg.is_file():
         print(f"No demo named '{name}'. Try: 'fairy-skel demos'", file=sys.stderr)
         sys.exit(2)
-    cfg = matches[0]
-    runner = ["fairy"] if (shutil.which("fairy")) else [sys.executable, "-m", "fairy.cli.run"]
-    subprocess.check_call(["bash", str(DEMO_DIR.parent / "scripts" / "run_demo.sh"), str(cfg)])
+    _run_demo(cfg)
 
 def main():
     ap = argparse.ArgumentParser(prog="fairy-skel", description="FAIRy-skeleton demo runner")
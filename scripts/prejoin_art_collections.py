@@ -1,28 +1,78 @@
 # scripts/prejoin_art_collections.py
 #!/usr/bin/env python
-import sys, csv
+import csv
+import sys
 
-art_path, artists_path, out_path = sys.argv[1:4]
+try:
+    import pandas as pd
+except ImportError:  # script still works with the stdlib alone
+    pd = None
 
-# --- detect the key column in artists.csv ---
-with open(artists_path, newline='', encoding='utf-8') as f:
-    rdr = csv.DictReader(f)
-    header = [h.strip() for h in rdr.fieldnames or []]
+
+def _find_key_col(header):
+    header = [h.strip() for h in header]
     key_col = "artistId" if "artistId" in header else ("id" if "id" in header else None)
     if not key_col:
         raise SystemExit(f"Could not find artist id column in artists.csv; saw: {header}")
-    artist_ids = { (row.get(key_col) or "").strip() for row in rdr if row.get(key_col) }
-
-# --- annotate artworks with presence flag ---
-with open(art_path, newline='', encoding='utf-8') as fin, \
-     open(out_path, "w", newline='', encoding='utf-8') as fout:
-    rdr = csv.DictReader(fin)
-    fieldnames = list(rdr.fieldnames or []) + ["artist_exists"]
-    w = csv.DictWriter(fout, fieldnames=fieldnames)
-    w.writeheader()
-    for row in rdr:
-        aid = (row.get("artistId") or "").strip()
-        row["artist_exists"] = "TRUE" if aid in artist_ids else "FALSE"
-        w.writerow(row)
-
-print(f"Wrote {out_path} with key_col={key_col} and {len(artist_ids)} artist ids")
+    return key_col
+
+
+def _join_pandas(art_path, artists_path, out_path):
+    # Read every cell as a literal string: no NaN, no "NA" -> missing coercion,
+    # so values round-trip byte-for-byte into the joined CSV.
+    read_opts = {"dtype": str, "keep_default_na": False, "na_filter": False}
+
+    # --- detect the key column in artists.csv ---
+    artists = pd.read_csv(artists_path, encoding="utf-8", **read_opts)
+    artists.columns = [h.strip() for h in artists.columns]
+    key_col = _find_key_col(artists.columns)
+    ids = artists[key_col]
+    artist_ids = set(ids[ids != ""].str.strip())
+
+    # --- annotate artworks with presence flag (one vectorized isin, no per-row loop) ---
+    art = pd.read_csv(art_path, encoding="utf-8", **read_opts)
+    if "artistId" in art.columns:
+        exists = art["artistId"].str.strip().isin(artist_ids)
+    else:
+        exists = pd.Series(False, index=art.index)
+    art["artist_exists"] = exists.map({True: "TRUE", False: "FALSE"})
+    # csv.writer-compatible output (minimal quoting, CRLF rows)
+    art.to_csv(out_path, index=False, encoding="utf-8", lineterminator="\r\n")
+    return key_col, artist_ids
+
+
+def _join_csv(art_path, artists_path, out_path):
+    # csv.reader + column index: rows stay plain lists (no dict per row)
+
+    # --- detect the key column in artists.csv ---
+    with open(artists_path, newline='', encoding='utf-8') as f:
+        rdr = csv.reader(f)
+        header = [h.strip() for h in next(rdr, [])]
+        key_col = _find_key_col(header)
+        key_idx = header.index(key_col)
+        artist_ids = {
+            row[key_idx].strip() for row in rdr if len(row) > key_idx and row[key_idx]
+        }
+
+    # --- annotate artworks with presence flag ---
+    with open(art_path, newline='', encoding='utf-8') as fin, \
+         open(out_path, "w", newline='', encoding='utf-8') as fout:
+        rdr = csv.reader(fin)
+        header = next(rdr, [])
+        aid_idx = header.index("artistId") if "artistId" in header else None
+        w = csv.writer(fout)
+        w.writerow(header + ["artist_exists"])
+        for row in rdr:
+            if len(row) < len(header):  # pad short rows, as DictWriter did
+                row += [""] * (len(header) - len(row))
+            aid = row[aid_idx].strip() if aid_idx is not None else ""
+            row.append("TRUE" if aid in artist_ids else "FALSE")
+            w.writerow(row)
+    return key_col, artist_ids
+
+
+if __name__ == "__main__":
+    art_path, artists_path, out_path = sys.argv[1:4]
+    join = _join_pandas if pd is not None else _join_csv
+    key_col, artist_ids = join(art_path, artists_path, out_path)
+    print(f"Wrote {out_path} with key_col={key_col} and {len(artist_ids)} artist ids")
@@ -1,4 +1,5 @@
 from pathlib import Path
+import hashlib
 import json
 import zipfile
 
@@ -41,6 +42,10 @@ def test_export_zip_smoke(tmp_path):
     assert isinstance(manifest, list) and len(manifest) >= 3
     for item in manifest:
         assert "path" in item and "sha256" in item and "bytes" in item
+        # digests reused from preflight must still match the bundled bytes
+        data = (res.export_dir / item["path"]).read_bytes()
+        assert item["sha256"] == hashlib.sha256(data).hexdigest()
+        assert item["bytes"] == len(data)
 
     # provenance carries minimal fields
     prov = json.loads(res.provenance_path.read_text(encoding="utf-8"))
@@ -0,0 +1,19 @@
+import pandas as pd
+
+from fairy.core.validators.rna import check_id_crossmatch
+
+
+def test_crossmatch_reports_rows_in_file_order():
+    """Per-id verdicts are broadcast back to every files.tsv row that repeats the id."""
+    samples = pd.DataFrame({"sample_id": ["S1", " S2", "S3"]})
+    files = pd.DataFrame({"sample_id": ["S1", "S2 ", "", "X", "S1", "  ", "X", "S3"]})
+
+    issues = check_id_crossmatch(samples, files, samples_key="sample_id")
+
+    assert [(w.kind, w.row) for w in issues] == [
+        ("file_missing_sample_id", 2),
+        ("file_unknown_sample_id", 3),
+        ("file_missing_sample_id", 5),
+        ("file_unknown_sample_id", 6),
+    ]
+    assert issues[1].message == "File references sample_id 'X' not found in samples.tsv."
@@ -0,0 +1,29 @@
+import pytest
+
+from fairy.core.services.validator import _read_tsv
+
+
+@pytest.mark.parametrize("token", ["NA", "N/A", "null", "nan", "NaN", "None", "#N/A"])
+def test_na_tokens_read_as_empty(tmp_path, token):
+    """NA-like cells stay blank, so e.g. tissue=NA still fails the bio-context check."""
+    p = tmp_path / "samples.tsv"
+    p.write_text(f"sample_id\ttissue\tcell_line\nS1\t{token}\t\nS2\tliver\t NA\n")
+
+    df = _read_tsv(p)
+
+    assert df["tissue"].tolist() == ["", "liver"]
+    assert df["cell_line"].tolist() == ["", " NA"]
+    assert not df.isna().to_numpy().any()
+
+
+def test_cells_keep_their_literal_text(tmp_path):
+    """No type guessing: numeric-looking ids keep leading zeros, booleans/floats stay as written."""
+    p = tmp_path / "samples.tsv"
+    p.write_text("sample_id\tpaired\tconc\tread_length\n007\tTRUE\t1.50\t100\n010\tFALSE\t2.0\t150\n")
+
+    df = _read_tsv(p)
+
+    assert df["sample_id"].tolist() == ["007", "010"]
+    assert df["paired"].tolist() == ["TRUE", "FALSE"]
+    assert df["conc"].tolist() == ["1.50", "2.0"]
+    assert df["read_length"].tolist() == ["100", "150"]
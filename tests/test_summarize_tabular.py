@@ -0,0 +1,34 @@
+import hashlib
+
+import pytest
+
+from fairy.core.services.validator import _summarize_tabular
+
+
+@pytest.mark.parametrize(
+    "content, n_rows",
+    [
+        (b"", 0),
+        (b"sample_id\ttissue", 0),
+        (b"sample_id\ttissue\n", 0),
+        (b"sample_id\ttissue\nS1\tliver", 1),
+        (b"sample_id\ttissue\nS1\tliver\nS2\tlung\n", 2),
+        (b"sample_id\ttissue\r\nS1\tliver\r\nS2\tlung\r\n", 2),
+        (b"sample_id\ttissue\rS1\tliver\rS2\tlung\r", 2),
+        (b"sample_id\ttissue\rS1\tliver\rS2\tlung", 2),
+    ],
+)
+def test_row_count_matches_line_semantics(tmp_path, content, n_rows):
+    """Row counting via newline count agrees with the old splitlines() behavior."""
+    p = tmp_path / "samples.tsv"
+    p.write_bytes(content)
+
+    meta = _summarize_tabular(p)
+
+    assert meta["n_rows"] == n_rows
+    assert meta["sha256"] == hashlib.sha256(content).hexdigest()
+    if content:
+        assert meta["header"] == ["sample_id", "tissue"]
+        assert meta["n_cols"] == 2
+    else:
+        assert meta["header"] == [] and meta["n_cols"] == 0